@@ -4,16 +4,18 @@
 This service handles integration between Monday.com and HubSpot.
 """
 
-from fastapi import FastAPI
+import os
 
-app = FastAPI()
+from shared.utils.app_factory import http_client_dependency, make_app
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+app = make_app(
+    "integration",
+    http_clients={
+        "monday": os.getenv("MONDAY_API_URL", "https://api.monday.com/v2"),
+        "hubspot": os.getenv("HUBSPOT_API_URL", "https://api.hubspot.com/"),
+    },
+)
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {"message": "Integration Service Running"} 
\ No newline at end of file
+# Dependencies returning the shared Monday.com and HubSpot HTTP clients
+get_monday_client = http_client_dependency("monday")
+get_hubspot_client = http_client_dependency("hubspot")
\ No newline at end of file
@@ -4,16 +4,6 @@
 This service handles centralized logging for all other services.
 """
 
-from fastapi import FastAPI
+from shared.utils.app_factory import make_app
 
-app = FastAPI()
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
-
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {"message": "Logger Service Running"} 
\ No newline at end of file
+app = make_app("logger")
\ No newline at end of file
@@ -4,16 +4,6 @@
 This service handles OAuth authentication for third-party providers.
 """
 
-from fastapi import FastAPI
+from shared.utils.app_factory import make_app
 
-app = FastAPI()
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
-
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {"message": "OAuth Service Running"} 
\ No newline at end of file
+app = make_app("oauth", display_name="OAuth Service")
\ No newline at end of file
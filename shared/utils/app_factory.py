@@ -0,0 +1,93 @@
+"""
+Application factory for all services.
+
+This module provides a factory that builds a FastAPI application with the
+endpoints, response class and lifespan shared by all microservices.
+"""
+
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+
+from shared.utils.http import HTTPClient, create_http_client
+from shared.utils.logging import setup_logging
+
+# Pre-serialized body of the health check response
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
+def make_app(
+    service_name: str,
+    display_name: Optional[str] = None,
+    http_clients: Optional[Dict[str, str]] = None,
+) -> FastAPI:
+    """Create a FastAPI application for a service.
+
+    The application exposes ``/health`` and ``/`` endpoints and uses a
+    lifespan that configures logging and creates the shared HTTP clients
+    for the process.
+
+    Args:
+        service_name: Name of the service, used for logging
+        display_name: Human readable service name for the root endpoint
+        http_clients: Mapping of client names to base URLs; one shared
+            HTTPClient is created per entry and stored in
+            ``app.state.http_clients``
+
+    Returns:
+        FastAPI: Configured application
+    """
+    display_name = display_name or f"{service_name.title()} Service"
+    root_body = orjson.dumps({"message": f"{display_name} Running"})
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Set up shared resources on startup and release them on shutdown."""
+        setup_logging(
+            service_name=service_name,
+            environment=os.getenv("ENVIRONMENT", "development"),
+            log_level=os.getenv("LOG_LEVEL", "INFO"),
+        )
+        app.state.http_clients = {
+            name: await create_http_client(base_url)
+            for name, base_url in (http_clients or {}).items()
+        }
+        try:
+            yield
+        finally:
+            for client in app.state.http_clients.values():
+                await client.close()
+
+    app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+    # Bodies are serialized once; a fresh Response is still built per
+    # request because middleware may mutate the response headers.
+    @app.get("/health", response_model=None)
+    async def health_check() -> Response:
+        """Health check endpoint."""
+        return Response(content=_HEALTH_BODY, media_type="application/json")
+
+    @app.get("/", response_model=None)
+    async def root() -> Response:
+        """Root endpoint."""
+        return Response(content=root_body, media_type="application/json")
+
+    return app
+
+
+def http_client_dependency(name: str) -> Callable[[Request], HTTPClient]:
+    """Create a dependency that returns a shared HTTP client.
+
+    Args:
+        name: Name the client was registered under in ``make_app``
+
+    Returns:
+        Callable[[Request], HTTPClient]: FastAPI dependency
+    """
+    def dependency(request: Request) -> HTTPClient:
+        return request.app.state.http_clients[name]
+    return dependency
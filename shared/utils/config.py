@@ -6,12 +6,93 @@
 """
 
 import os
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, TypeVar, Union, overload
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=None)
+def _db_env_defaults() -> Tuple[int, int, int, int]:
+    """Read database pool settings from the environment once per process.
+
+    Returns:
+        Tuple[int, int, int, int]: Pool size, max overflow, pool timeout
+            and pool recycle interval
+    """
+    return (
+        int(os.getenv("DB_POOL_SIZE", "20")),
+        int(os.getenv("DB_MAX_OVERFLOW", "30")),
+        int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    )
+
+
+# The derived settings below are cached on the field values they depend on
+# rather than on the settings instance, so copies and field assignment never
+# see a stale result.
+@lru_cache(maxsize=None)
+def _service_url(environment: str, service_port: int) -> str:
+    """Resolve the service URL for an environment and port.
+
+    Args:
+        environment: Deployment environment
+        service_port: Port the service runs on
+
+    Returns:
+        str: Service URL
+    """
+    if environment == "development":
+        return f"http://localhost:{service_port}"
+    return os.getenv("SERVICE_URL", f"http://localhost:{service_port}")
+
+
+@lru_cache(maxsize=None)
+def _cors_settings(
+    allowed_origins: Tuple[str, ...],
+) -> Mapping[str, Union[Tuple[str, ...], bool]]:
+    """Build read-only CORS settings for a set of allowed origins.
+
+    Args:
+        allowed_origins: Allowed CORS origins
+
+    Returns:
+        Mapping[str, Union[Tuple[str, ...], bool]]: CORS settings
+    """
+    return MappingProxyType({
+        "allow_origins": allowed_origins,
+        "allow_credentials": True,
+        "allow_methods": ("*",),
+        "allow_headers": ("*",),
+    })
+
+
+@lru_cache(maxsize=None)
+def _rate_limit_settings(
+    enabled: bool, requests: int, period: int
+) -> Mapping[str, Any]:
+    """Build read-only rate limiting settings.
+
+    Args:
+        enabled: Whether rate limiting is enabled
+        requests: Number of requests allowed per period
+        period: Rate limit period in seconds
+
+    Returns:
+        Mapping[str, Any]: Rate limit settings
+    """
+    if not enabled:
+        return MappingProxyType({"enabled": False})
+
+    return MappingProxyType({
+        "enabled": True,
+        "requests": requests,
+        "period": period,
+    })
+
+
 class BaseServiceSettings(BaseSettings):
     """Base configuration settings for all services.
 
@@ -54,6 +135,26 @@ class BaseServiceSettings(BaseSettings):
     database_url: str = Field(
         description="Database connection URL",
     )
+    db_pool_size: int = Field(
+        default_factory=lambda: _db_env_defaults()[0],
+        description="Size of the database connection pool",
+    )
+    db_max_overflow: int = Field(
+        default_factory=lambda: _db_env_defaults()[1],
+        description="Connections allowed beyond the pool size",
+    )
+    db_pool_timeout: int = Field(
+        default_factory=lambda: _db_env_defaults()[2],
+        description="Seconds to wait for a pooled connection",
+    )
+    db_pool_recycle: int = Field(
+        default_factory=lambda: _db_env_defaults()[3],
+        description="Seconds after which pooled connections are recycled",
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Whether to test pooled connections before use",
+    )
 
     # Security settings
     jwt_secret_key: Optional[str] = Field(
@@ -95,9 +196,11 @@ def get_database_settings(self) -> Dict[str, Any]:
         # For PostgreSQL and MySQL, parse connection URL for additional settings
         return {
             "url": self.database_url,
-            "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
-            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
-            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": self.db_pool_pre_ping,
         }
 
     def get_service_url(self) -> str:
@@ -106,34 +209,72 @@ def get_service_url(self) -> str:
         Returns:
             str: Service URL
         """
-        if self.environment == "development":
-            return f"http://localhost:{self.service_port}"
-        return os.getenv("SERVICE_URL", f"http://localhost:{self.service_port}")
+        return _service_url(self.environment, self.service_port)
 
-    def get_cors_settings(self) -> Dict[str, Union[list[str], bool]]:
+    def get_cors_settings(self) -> Mapping[str, Union[Tuple[str, ...], bool]]:
         """Get CORS settings for the service.
 
+        The result is cached and shared, so it is returned read-only.
+
         Returns:
-            Dict[str, Union[list[str], bool]]: CORS settings
+            Mapping[str, Union[Tuple[str, ...], bool]]: CORS settings
         """
-        return {
-            "allow_origins": self.cors_allowed_origins,
-            "allow_credentials": True,
-            "allow_methods": ["*"],
-            "allow_headers": ["*"],
-        }
+        return _cors_settings(tuple(self.cors_allowed_origins))
 
-    def get_rate_limit_settings(self) -> Dict[str, Any]:
+    def get_rate_limit_settings(self) -> Mapping[str, Any]:
         """Get rate limiting settings for the service.
 
+        The result is cached and shared, so it is returned read-only.
+
         Returns:
-            Dict[str, Any]: Rate limit settings
+            Mapping[str, Any]: Rate limit settings
         """
-        if not self.rate_limit_enabled:
-            return {"enabled": False}
-        
-        return {
-            "enabled": True,
-            "requests": self.rate_limit_requests,
-            "period": self.rate_limit_period,
-        } 
\ No newline at end of file
+        return _rate_limit_settings(
+            self.rate_limit_enabled,
+            self.rate_limit_requests,
+            self.rate_limit_period,
+        )
+
+
+SettingsType = TypeVar("SettingsType", bound=BaseServiceSettings)
+
+
+@lru_cache(maxsize=None)
+def _get_settings(settings_class: Type[BaseServiceSettings]) -> BaseServiceSettings:
+    """Instantiate a settings class once per process.
+
+    Args:
+        settings_class: Settings class to instantiate
+
+    Returns:
+        BaseServiceSettings: Cached settings instance
+    """
+    return settings_class()  # type: ignore[call-arg]
+
+
+@overload
+def get_settings() -> BaseServiceSettings:
+    ...
+
+
+@overload
+def get_settings(settings_class: Type[SettingsType]) -> SettingsType:
+    ...
+
+
+def get_settings(
+    settings_class: Type[BaseServiceSettings] = BaseServiceSettings,
+) -> BaseServiceSettings:
+    """Get the process-wide settings instance for a settings class.
+
+    Settings are loaded and validated once per class; later calls return
+    the same instance however the class is passed. Suitable for use as a
+    FastAPI dependency.
+
+    Args:
+        settings_class: Settings class to instantiate
+
+    Returns:
+        BaseServiceSettings: Cached settings instance
+    """
+    return _get_settings(settings_class)
@@ -6,9 +6,10 @@
 """
 
 import contextlib
-from typing import Any, AsyncGenerator, Dict, Optional, Type, TypeVar
+from functools import cached_property
+from typing import Any, AsyncGenerator, Dict, Generic, Optional, Type, TypeVar
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, delete, inspect, update
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -17,6 +18,7 @@
 )
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
+from shared.utils.config import get_settings
 from shared.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -29,7 +31,9 @@ class Database:
     """Database connection manager.
 
     This class manages database connections and sessions for both
-    synchronous and asynchronous database operations.
+    synchronous and asynchronous database operations. Engines and
+    session factories are created lazily, so a service that only uses
+    async sessions never opens a sync connection pool.
 
     Attributes:
         engine: SQLAlchemy engine instance
@@ -42,9 +46,11 @@ def __init__(
         self,
         database_url: str,
         echo: bool = False,
-        pool_size: int = 5,
-        max_overflow: int = 10,
+        pool_size: int = 20,
+        max_overflow: int = 30,
         pool_timeout: int = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
     ) -> None:
         """Initialize database connection manager.
 
@@ -54,46 +60,87 @@ def __init__(
             pool_size: Size of the connection pool
             max_overflow: Maximum number of connections to create beyond pool_size
             pool_timeout: Number of seconds to wait before giving up on getting a connection
+            pool_recycle: Number of seconds after which a connection is recycled
+            pool_pre_ping: Whether to test connections for liveness on checkout
         """
         self.database_url = database_url
         self.echo = echo
-        
-        # Create engines based on URL scheme
-        if database_url.startswith("sqlite"):
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.is_sqlite = database_url.startswith("sqlite")
+
+    def _engine_options(self) -> Dict[str, Any]:
+        """Get engine options shared by the sync and async engines.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for engine creation
+        """
+        if self.is_sqlite:
+            return {"echo": self.echo}
+
+        # PostgreSQL/MySQL configuration
+        return {
+            "echo": self.echo,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+
+    @cached_property
+    def engine(self) -> Engine:
+        """SQLAlchemy engine, created on first access.
+
+        Returns:
+            Engine: Sync database engine
+        """
+        if self.is_sqlite:
             # SQLite specific configuration
-            self.engine = create_engine(
-                database_url,
-                echo=echo,
+            return create_engine(
+                self.database_url,
                 connect_args={"check_same_thread": False},
+                **self._engine_options(),
             )
-            self.async_engine = create_async_engine(
-                database_url.replace("sqlite:", "sqlite+aiosqlite:"),
-                echo=echo,
-            )
+        return create_engine(self.database_url, **self._engine_options())
+
+    @cached_property
+    def async_engine(self) -> AsyncEngine:
+        """SQLAlchemy async engine, created on first access.
+
+        Returns:
+            AsyncEngine: Async database engine
+        """
+        if self.is_sqlite:
+            url = self.database_url.replace("sqlite:", "sqlite+aiosqlite:")
         else:
-            # PostgreSQL/MySQL configuration
-            self.engine = create_engine(
-                database_url,
-                echo=echo,
-                pool_size=pool_size,
-                max_overflow=max_overflow,
-                pool_timeout=pool_timeout,
-            )
-            self.async_engine = create_async_engine(
-                database_url.replace("postgresql:", "postgresql+asyncpg:"),
-                echo=echo,
-                pool_size=pool_size,
-                max_overflow=max_overflow,
-                pool_timeout=pool_timeout,
-            )
+            url = self.database_url.replace("postgresql:", "postgresql+asyncpg:")
+        return create_async_engine(url, **self._engine_options())
 
-        # Create session factories
-        self.session_factory = sessionmaker(
+    @cached_property
+    def session_factory(self) -> sessionmaker:
+        """Factory for sync sessions, created on first access.
+
+        Returns:
+            sessionmaker: Sync session factory
+        """
+        return sessionmaker(
             bind=self.engine,
             autocommit=False,
             autoflush=False,
         )
-        self.async_session_factory = async_sessionmaker(
+
+    @cached_property
+    def async_session_factory(self) -> async_sessionmaker:
+        """Factory for async sessions, created on first access.
+
+        Returns:
+            async_sessionmaker: Async session factory
+        """
+        return async_sessionmaker(
             bind=self.async_engine,
             autocommit=False,
             autoflush=False,
@@ -141,6 +188,13 @@ async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+    async def close(self) -> None:
+        """Dispose of any engines that have been created."""
+        if "async_engine" in self.__dict__:
+            await self.async_engine.dispose()
+        if "engine" in self.__dict__:
+            self.engine.dispose()
+
     async def create_database(self) -> None:
         """Create all database tables."""
         async with self.async_engine.begin() as conn:
@@ -152,7 +206,7 @@ async def drop_database(self) -> None:
             await conn.run_sync(DeclarativeBase.metadata.drop_all)
 
 
-class BaseRepository:
+class BaseRepository(Generic[ModelType]):
     """Base repository for database operations.
 
     This class provides basic CRUD operations that can be inherited
@@ -206,6 +260,9 @@ async def update(
     ) -> Optional[ModelType]:
         """Update a record.
 
+        The update is issued as a single ``UPDATE ... RETURNING`` statement
+        instead of loading, modifying and refreshing the instance.
+
         Args:
             id: Record ID
             **kwargs: Attributes to update
@@ -213,18 +270,28 @@ async def update(
         Returns:
             Optional[ModelType]: Updated model instance or None
         """
+        if not kwargs:
+            return await self.get(id)
+
         async with self.db.get_async_session() as session:
-            instance = await session.get(self.model, id)
-            if instance:
-                for key, value in kwargs.items():
-                    setattr(instance, key, value)
-                await session.commit()
-                await session.refresh(instance)
+            result = await session.execute(
+                update(self.model)
+                .where(self._primary_key == id)
+                .values(**kwargs)
+                .returning(self.model)
+            )
+            instance = result.scalar_one_or_none()
+            if instance is not None:
+                # Detach so the commit on exit does not expire loaded attributes
+                session.expunge(instance)
             return instance
 
     async def delete(self, id: Any) -> bool:
         """Delete a record.
 
+        The delete is issued as a single ``DELETE ... RETURNING`` statement,
+        so ORM-level cascades and delete events are not triggered.
+
         Args:
             id: Record ID
 
@@ -232,27 +299,41 @@ async def delete(self, id: Any) -> bool:
             bool: True if record was deleted, False otherwise
         """
         async with self.db.get_async_session() as session:
-            instance = await session.get(self.model, id)
-            if instance:
-                await session.delete(instance)
-                await session.commit()
-                return True
-            return False
+            result = await session.execute(
+                delete(self.model)
+                .where(self._primary_key == id)
+                .returning(self._primary_key)
+            )
+            return result.scalar_one_or_none() is not None
+
+    @property
+    def _primary_key(self) -> Any:
+        """Primary key column of the repository model.
+
+        Returns:
+            Any: Primary key column
+        """
+        return inspect(self.model).primary_key[0]
 
 
-def get_database(settings: Dict[str, Any]) -> Database:
+def get_database(settings: Optional[Dict[str, Any]] = None) -> Database:
     """Create a database instance from settings.
 
     Args:
-        settings: Database settings dictionary
+        settings: Database settings dictionary; defaults to the database
+            settings of the cached service settings
 
     Returns:
         Database: Configured database instance
     """
+    if settings is None:
+        settings = get_settings().get_database_settings()
     return Database(
         database_url=settings["url"],
         echo=settings.get("echo", False),
-        pool_size=settings.get("pool_size", 5),
-        max_overflow=settings.get("max_overflow", 10),
+        pool_size=settings.get("pool_size", 20),
+        max_overflow=settings.get("max_overflow", 30),
         pool_timeout=settings.get("pool_timeout", 30),
+        pool_recycle=settings.get("pool_recycle", 1800),
+        pool_pre_ping=settings.get("pool_pre_ping", True),
     ) 
\ No newline at end of file
@@ -6,22 +6,20 @@
 """
 
 import asyncio
-from datetime import datetime
-from typing import Any, Dict, Optional, Union
-from urllib.parse import urljoin
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import orjson
 
 from shared.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of bytes of an error response body kept for logging
+MAX_ERROR_BODY_BYTES = 2048
+
 
 class HTTPClientError(Exception):
     """Base exception for HTTP client errors.
@@ -60,8 +58,12 @@ class HTTPClient:
     Attributes:
         base_url: Base URL for all requests
         timeout: Request timeout in seconds
-        max_retries: Maximum number of retry attempts
+        max_retries: Maximum number of attempts per request, including
+            the first one
         auth_header: Authorization header value
+
+    A client owns a connection pool, so services should create one per
+    remote at startup and share it rather than creating one per call.
     """
 
     def __init__(
@@ -70,22 +72,47 @@ def __init__(
         timeout: float = 30.0,
         max_retries: int = 3,
         auth_header: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 50,
+        http2: bool = True,
     ) -> None:
         """Initialize HTTP client.
 
         Args:
             base_url: Base URL for all requests
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts per request, including
+                the first one
             auth_header: Authorization header value
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            http2: Whether to enable HTTP/2 support
         """
         self.base_url = base_url.rstrip("/") + "/"
         self.timeout = timeout
         self.max_retries = max_retries
         self.auth_header = auth_header
+
+        base_headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        if auth_header:
+            base_headers["Authorization"] = auth_header
+        self._base_headers: Mapping[str, str] = MappingProxyType(base_headers)
+
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
+            # Retries are handled by request(); keep the transport from retrying
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                http2=http2,
+                retries=0,
+            ),
         )
 
     async def __aenter__(self) -> "HTTPClient":
@@ -112,24 +139,19 @@ async def close(self) -> None:
 
     def _get_headers(
         self, additional_headers: Optional[Dict[str, str]] = None
-    ) -> Dict[str, str]:
+    ) -> Mapping[str, str]:
         """Get request headers.
 
         Args:
             additional_headers: Additional headers to include
 
         Returns:
-            Dict[str, str]: Combined headers
+            Mapping[str, str]: Combined headers; the shared read-only base
+                headers when there is nothing to add
         """
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        if self.auth_header:
-            headers["Authorization"] = self.auth_header
-        if additional_headers:
-            headers.update(additional_headers)
-        return headers
+        if not additional_headers:
+            return self._base_headers
+        return {**self._base_headers, **additional_headers}
 
     def _build_url(self, path: str) -> str:
         """Build full URL from path.
@@ -140,15 +162,39 @@ def _build_url(self, path: str) -> str:
         Returns:
             str: Full URL
         """
-        return urljoin(self.base_url, path.lstrip("/"))
-
-    @retry(
-        retry=retry_if_exception_type(
-            (httpx.TimeoutException, httpx.TransportError)
-        ),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-    )
+        # base_url is normalized to end with "/" in __init__
+        return self.base_url + path.lstrip("/")
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        kwargs: Dict[str, Any],
+    ) -> httpx.Response:
+        """Send a single request attempt.
+
+        Args:
+            method: HTTP method
+            url: Full URL
+            headers: Request headers
+            kwargs: Additional arguments for the request
+
+        Returns:
+            httpx.Response: Successful HTTP response
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        response = await self.client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            **kwargs,
+        )
+        response.raise_for_status()
+        return response
+
     async def request(
         self,
         method: str,
@@ -157,6 +203,9 @@ async def request(
     ) -> httpx.Response:
         """Make an HTTP request with retry logic.
 
+        Timeouts and transport errors are retried until ``max_retries``
+        attempts have been made in total, with exponential backoff capped at 10 seconds.
+
         Args:
             method: HTTP method
             path: URL path
@@ -170,17 +219,32 @@ async def request(
         """
         url = self._build_url(path)
         headers = self._get_headers(kwargs.pop("headers", None))
-        start_time = datetime.utcnow()
+        json_body = kwargs.pop("json", None)
+        attempts = max(1, self.max_retries)
+        start_time = time.perf_counter()
 
         try:
-            response = await self.client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                **kwargs,
-            )
-            response.raise_for_status()
-            return response
+            if json_body is not None:
+                # httpx encodes json= with the stdlib encoder; orjson is faster.
+                # Non-str dict keys are stringified as the stdlib encoder does.
+                kwargs["content"] = orjson.dumps(
+                    json_body, option=orjson.OPT_NON_STR_KEYS
+                )
+            for attempt in range(attempts - 1):
+                try:
+                    return await self._send(method, url, headers, kwargs)
+                except httpx.TransportError as e:
+                    delay = min(10, 4 * 2 ** attempt)
+                    logger.warning(
+                        "Retrying request",
+                        url=url,
+                        method=method,
+                        attempt=attempt + 1,
+                        delay=delay,
+                        error=str(e),
+                    )
+                    await asyncio.sleep(delay)
+            return await self._send(method, url, headers, kwargs)
 
         except httpx.TimeoutException as e:
             logger.error(
@@ -194,17 +258,20 @@ async def request(
             )
 
         except httpx.HTTPStatusError as e:
+            body = e.response.content[:MAX_ERROR_BODY_BYTES].decode(
+                "utf-8", "replace"
+            )
             logger.error(
                 "HTTP error response",
                 url=url,
                 method=method,
                 status_code=e.response.status_code,
-                response_body=e.response.text,
+                response_body=body,
             )
             raise HTTPClientError(
                 f"HTTP {e.response.status_code}",
                 status_code=e.response.status_code,
-                response_body=e.response.text,
+                response_body=body,
             )
 
         except Exception as e:
@@ -217,7 +284,7 @@ async def request(
             raise HTTPClientError(f"Request failed: {str(e)}")
 
         finally:
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.info(
                 "HTTP request completed",
                 url=url,
@@ -5,17 +5,40 @@
 that can be used across all microservices.
 """
 
+import asyncio
 import json
 import logging
 import sys
 from datetime import datetime
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
+import orjson
 import structlog
 from pythonjsonlogger import jsonlogger
 from structlog.types import EventDict, Processor, WrappedLogger
 
+# Mapping of level names to stdlib logging levels
+_LEVELS: Dict[str, int] = logging.getLevelNamesMapping()
+
+# Threshold configured by setup_logging; events below it are dropped
+_configured_level: int = logging.NOTSET
+
+# Cached (epoch second, formatted prefix) used by _format_record_time
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+# Static structlog processors run before and after the per-service ones
+_PRE_PROCESSORS: Tuple[Processor, ...] = (
+    structlog.processors.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp"),
+)
+_POST_PROCESSORS: Tuple[Processor, ...] = (
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+)
+
 
 def add_timestamp(
     logger: WrappedLogger, name: str, event_dict: EventDict
@@ -34,6 +57,27 @@ def add_timestamp(
     return event_dict
 
 
+def _format_record_time(created: float) -> str:
+    """Format a record creation time as an ISO-8601 UTC timestamp.
+
+    The second-granularity prefix is cached and only rebuilt when the
+    second changes, so most records only format the microseconds.
+
+    Args:
+        created: Record creation time in seconds since the epoch
+
+    Returns:
+        str: ISO-format timestamp
+    """
+    global _timestamp_cache
+    seconds = int(created)
+    cached_seconds, prefix = _timestamp_cache
+    if seconds != cached_seconds:
+        prefix = datetime.utcfromtimestamp(seconds).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_cache = (seconds, prefix)
+    return f"{prefix}.{int((created - seconds) * 1_000_000):06d}"
+
+
 def add_service_info(
     service_name: str, environment: str
 ) -> Processor:
@@ -88,12 +132,27 @@ def add_fields(
         super().add_fields(log_record, record, message_dict)
         
         if not log_record.get("timestamp"):
-            log_record["timestamp"] = datetime.utcnow().isoformat()
+            log_record["timestamp"] = _format_record_time(record.created)
         if log_record.get("level"):
             log_record["level"] = log_record["level"].upper()
         else:
             log_record["level"] = record.levelname
 
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """Serialize the log record to JSON using orjson.
+
+        Args:
+            log_record: The log record to serialize
+
+        Returns:
+            str: JSON-encoded log record
+        """
+        return orjson.dumps(
+            log_record,
+            default=self.json_default or str,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
 
 def setup_logging(
     service_name: str,
@@ -109,36 +168,37 @@ def setup_logging(
         log_level: Logging level to use
         json_output: Whether to output logs in JSON format
     """
+    global _configured_level
+
     # Convert string log level to integer if needed
     if isinstance(log_level, str):
-        log_level = getattr(logging, log_level.upper())
+        log_level = _LEVELS[log_level.upper()]
+    _configured_level = log_level
 
     # Configure structlog
+    renderer = (
+        structlog.processors.JSONRenderer()
+        if json_output
+        else structlog.dev.ConsoleRenderer()
+    )
     processors = [
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.processors.TimeStamper(fmt="iso"),
+        *_PRE_PROCESSORS,
         add_service_info(service_name, environment),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
+        *_POST_PROCESSORS,
+        renderer,
     ]
 
-    if json_output:
-        processors.append(structlog.processors.JSONRenderer())
-    else:
-        processors.append(structlog.dev.ConsoleRenderer())
-
     structlog.configure(
         processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         cache_logger_on_first_use=True,
     )
 
     # Configure standard logging
     handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(log_level)
     if json_output:
         formatter = CustomJsonFormatter(
             "%(timestamp)s %(level)s %(name)s %(message)s"
@@ -168,6 +228,11 @@ def log_function_call(
 ) -> Callable:
     """Decorator to log function calls with arguments and return values.
 
+    Both regular and coroutine functions are supported. When ``level`` is
+    below the threshold configured by ``setup_logging`` the call is passed
+    straight through without building any log events; exceptions are
+    always logged.
+
     Args:
         logger: Logger instance to use (if None, creates one)
         level: Log level to use for the messages
@@ -180,36 +245,74 @@ def decorator(func: Callable) -> Callable:
         if logger is None:
             logger = get_logger(func.__module__)
 
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            func_name = func.__name__
-            log_level = getattr(logging, level.upper())
-
-            # Log function call
-            logger.log(
-                log_level,
-                f"Calling {func_name}",
-                args=args,
-                kwargs=kwargs
+        func_name = func.__name__
+        # structlog only emits named levels, so NOTSET is logged at DEBUG
+        log_level = max(_LEVELS[level.upper()], logging.DEBUG)
+
+        def log_error(e: Exception) -> None:
+            logger.exception(
+                "call_failed",
+                function=func_name,
+                error=str(e),
+                error_type=type(e).__name__
             )
 
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    if log_level < _configured_level:
+                        return await func(*args, **kwargs)
+
+                    # Log function call
+                    logger.log(
+                        log_level,
+                        "call",
+                        function=func_name,
+                        args=args,
+                        kwargs=kwargs
+                    )
+                    result = await func(*args, **kwargs)
+                    # Log successful return
+                    logger.log(
+                        log_level,
+                        "call_completed",
+                        function=func_name,
+                        result=result
+                    )
+                    return result
+                except Exception as e:
+                    log_error(e)
+                    raise
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
+                if log_level < _configured_level:
+                    return func(*args, **kwargs)
+
+                # Log function call
+                logger.log(
+                    log_level,
+                    "call",
+                    function=func_name,
+                    args=args,
+                    kwargs=kwargs
+                )
                 result = func(*args, **kwargs)
                 # Log successful return
                 logger.log(
                     log_level,
-                    f"{func_name} completed",
+                    "call_completed",
+                    function=func_name,
                     result=result
                 )
                 return result
             except Exception as e:
-                # Log exception
-                logger.exception(
-                    f"Error in {func_name}",
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
+                log_error(e)
                 raise
 
         return wrapper
-    return decorator 
\ No newline at end of file
+    return decorator
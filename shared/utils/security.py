@@ -5,27 +5,50 @@
 authentication, and authorization that can be used across all microservices.
 """
 
+import asyncio
 import base64
+import binascii
 import hashlib
 import hmac
 import os
 import secrets
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
-
-from cryptography.fernet import Fernet
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+import bcrypt
+import orjson
+from cachetools import TTLCache
 from fastapi import HTTPException, Request, Security
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from shared.utils.logging import get_logger
 
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.ciphers import Cipher, modes
+    from cryptography.hazmat.primitives.ciphers.algorithms import AES
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = get_logger(__name__)
 
 # API key header
 api_key_header = APIKeyHeader(name="X-API-Key")
@@ -33,6 +56,175 @@
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Token generator used for API keys
+_token_urlsafe = secrets.token_urlsafe
+
+# SHA-256 constructor used for API keys. On OpenSSL-linked interpreters this is
+# OpenSSL's implementation, which already dispatches to SHA-NI when available.
+_sha256 = hashlib.sha256
+
+# Maximum number and lifetime in seconds of remembered unknown API keys
+INVALID_API_KEY_CACHE_SIZE = 10_000
+INVALID_API_KEY_CACHE_TTL = 5
+
+# Maximum number and lifetime in seconds of API keys confirmed by the key
+# store; bounds how long a key revoked elsewhere is still accepted
+VERIFIED_API_KEY_CACHE_SIZE = 10_000
+VERIFIED_API_KEY_CACHE_TTL = 60
+
+# Maximum number of verified tokens kept per SecurityConfig
+TOKEN_CACHE_SIZE = 10_000
+
+# Maximum number and lifetime in seconds of remembered invalid tokens
+INVALID_TOKEN_CACHE_SIZE = 10_000
+INVALID_TOKEN_CACHE_TTL = 5
+
+# Digest size in bytes of the keys remembering rejected tokens
+_TOKEN_DIGEST_SIZE = 16
+
+# HMAC JWT algorithms signed and verified inline rather than through PyJWT
+_HMAC_ALGORITHMS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+# bcrypt cost factor used for new password hashes
+BCRYPT_ROUNDS = 12
+
+# bcrypt only uses the first 72 bytes of a password
+_BCRYPT_MAX_BYTES = 72
+
+# Bounds concurrent bcrypt computations so login bursts cannot oversubscribe
+# the CPUs; the C implementation releases the GIL while hashing.
+_bcrypt_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+# Process-wide pool for async bcrypt work, shared by all SecurityConfig
+# instances; worker threads are only started on first use.
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt",
+)
+
+
+# Fernet token layout: version byte, 8-byte timestamp, 16-byte IV, AES-CBC
+# ciphertext and a 32-byte HMAC-SHA256 over everything before it
+_FERNET_VERSION = b"\x80"
+_FERNET_IV_OFFSET = 9
+_FERNET_CIPHERTEXT_OFFSET = 25
+_FERNET_MAC_SIZE = 32
+_AES_BLOCK_SIZE = 16
+
+
+class _EntropyPool:
+    """Buffer of OS randomness handed out in slices.
+
+    Reading ``os.urandom`` in larger chunks replaces one syscall per
+    key or IV with one per ``refill_size`` bytes. Bytes are removed from
+    the buffer as they are handed out, and the buffer is discarded in
+    forked children so processes never share random bytes.
+    """
+
+    def __init__(self, refill_size: int = 4096) -> None:
+        """Initialize the entropy pool.
+
+        Args:
+            refill_size: Number of bytes read from the OS per refill
+        """
+        self._refill_size = refill_size
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+
+    def take(self, n: int) -> bytes:
+        """Take random bytes from the pool.
+
+        Args:
+            n: Number of bytes
+
+        Returns:
+            bytes: Random bytes
+        """
+        with self._lock:
+            if len(self._buf) < n:
+                self._buf += os.urandom(max(n, self._refill_size))
+            chunk = bytes(self._buf[:n])
+            del self._buf[:n]
+            return chunk
+
+    def reset(self) -> None:
+        """Discard buffered bytes, e.g. after a fork."""
+        self._lock = threading.Lock()
+        self._buf = bytearray()
+
+
+_entropy_pool = _EntropyPool()
+os.register_at_fork(after_in_child=_entropy_pool.reset)
+
+
+# Shared by SecurityConfig and APIKeyCache so both hash keys the same way.
+# Deliberately not memoized: a memo would keep plaintext keys in memory and
+# save less than the lookup costs.
+def _hash_api_key_digest(api_key: str) -> bytes:
+    """Compute the SHA-256 digest of an API key.
+
+    Args:
+        api_key: API key to hash
+
+    Returns:
+        bytes: 32-byte SHA-256 digest of the API key
+    """
+    return _sha256(api_key.encode()).digest()
+
+
+def _token_digest(token: str) -> bytes:
+    """Compute a short fixed-size cache key for a token.
+
+    Args:
+        token: Token to digest
+
+    Returns:
+        bytes: BLAKE2b digest of the token
+    """
+    return hashlib.blake2b(
+        token.encode(), digest_size=_TOKEN_DIGEST_SIZE
+    ).digest()
+
+
+# Translation tables between the standard and URL-safe base64 alphabets
+_TO_URLSAFE = bytes.maketrans(b"+/", b"-_")
+_FROM_URLSAFE = bytes.maketrans(b"-_", b"+/")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode data without padding, as used in JWTs.
+
+    Args:
+        data: Data to encode
+
+    Returns:
+        bytes: Encoded data
+    """
+    encoded = binascii.b2a_base64(data, newline=False)
+    return encoded.translate(_TO_URLSAFE).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode unpadded base64url data, as used in JWTs.
+
+    Args:
+        data: Data to decode
+
+    Returns:
+        bytes: Decoded data
+
+    Raises:
+        ValueError: If the data is not valid base64url
+    """
+    return binascii.a2b_base64(
+        data.translate(_FROM_URLSAFE) + b"=" * (-len(data) % 4)
+    )
+
 
 class Token(BaseModel):
     """Token model for authentication responses.
@@ -43,22 +235,33 @@ class Token(BaseModel):
         expires_in: Number of seconds until token expires
     """
 
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+    )
+
     access_token: str
     token_type: str
     expires_in: int
 
 
-class TokenData(BaseModel):
-    """Token data model for JWT payload.
+@dataclass(slots=True, frozen=True)
+class TokenData:
+    """Token data decoded from a JWT payload.
+
+    This is an internal value object built on every verification, so it is
+    a plain dataclass rather than a validated Pydantic model. It is frozen
+    because verified instances are shared between callers by the token cache.
 
     Attributes:
         sub: Subject of the token (usually user ID)
-        exp: Expiration timestamp
+        exp: Expiration time in seconds since the epoch
         scope: Token scope/permissions
     """
 
     sub: str
-    exp: datetime
+    exp: float
     scope: Optional[str] = None
 
 
@@ -82,7 +285,7 @@ def __init__(
         algorithm: str = "HS256",
         access_token_expire_minutes: int = 30,
         api_key_expire_days: int = 30,
-        encryption_key: Optional[str] = None,
+        encryption_key: Optional[Union[str, bytes]] = None,
     ) -> None:
         """Initialize security configuration.
 
@@ -91,23 +294,189 @@ def __init__(
             algorithm: Algorithm used for JWT signing
             access_token_expire_minutes: Token expiration time in minutes
             api_key_expire_days: API key expiration time in days
-            encryption_key: Key used for Fernet encryption
+            encryption_key: Key used for Fernet encryption, as str or bytes
         """
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode()
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.api_key_expire_days = api_key_expire_days
+        if isinstance(encryption_key, str):
+            encryption_key = encryption_key.encode()
         self.encryption_key = encryption_key or self._generate_encryption_key()
-        self.fernet = Fernet(self.encryption_key.encode())
+
+        # Verified tokens mapped to their decoded (immutable) data; entries
+        # are handed to every caller presenting the same token
+        self._token_cache: TTLCache[str, TokenData] = TTLCache(
+            maxsize=TOKEN_CACHE_SIZE,
+            ttl=access_token_expire_minutes * 60,
+        )
+        # Digests of recently rejected tokens, so repeated invalid tokens skip
+        # decoding; keyed on a digest so oversized junk tokens stay cheap to hold
+        self._invalid_token_cache: TTLCache[bytes, bool] = TTLCache(
+            maxsize=INVALID_TOKEN_CACHE_SIZE,
+            ttl=INVALID_TOKEN_CACHE_TTL,
+        )
+        self._token_cache_lock = threading.Lock()
+
+        # Keyed HMAC state for inline signing; copying it per token skips
+        # re-deriving the padded inner and outer keys from the secret.
+        digestmod = _HMAC_ALGORITHMS.get(algorithm)
+        self._hmac_template: Optional[hmac.HMAC] = (
+            hmac.new(self._secret_bytes, digestmod=digestmod)
+            if digestmod is not None
+            else None
+        )
+        # The header only depends on the algorithm, so it is encoded once
+        self._header_b64 = _b64url_encode(
+            orjson.dumps({"alg": self.algorithm, "typ": "JWT"})
+        )
+        self._token_prefix = self._header_b64 + b"."
+
+    @cached_property
+    def fernet(self) -> "Fernet":
+        """Fernet instance for the encryption key, created on first use.
+
+        Returns:
+            Fernet: Fernet instance
+        """
+        from cryptography.fernet import Fernet
+
+        return Fernet(self.encryption_key)
+
+    @cached_property
+    def _fernet_keys(
+        self,
+    ) -> Tuple[hmac.HMAC, "AES", Type["Cipher[Any]"], Type["modes.CBC"]]:
+        """Fernet signing and encryption state, derived once from the key.
+
+        The cipher classes are resolved here too, so encrypting and
+        decrypting do not repeat the imports on every call.
+
+        Returns:
+            Tuple[hmac.HMAC, AES, Type[Cipher], Type[CBC]]: Keyed HMAC-SHA256
+                template, AES-128 key, cipher class and CBC mode class
+        """
+        from cryptography.hazmat.primitives.ciphers import Cipher, modes
+        from cryptography.hazmat.primitives.ciphers.algorithms import AES
+
+        key = base64.urlsafe_b64decode(self.encryption_key)
+        if len(key) != 32:
+            raise ValueError("Fernet key must be 32 url-safe base64-encoded bytes.")
+        return (
+            hmac.new(key[:16], digestmod=hashlib.sha256),
+            AES(key[16:]),
+            Cipher,
+            modes.CBC,
+        )
 
     @staticmethod
-    def _generate_encryption_key() -> str:
+    def _generate_encryption_key() -> bytes:
         """Generate a new Fernet encryption key.
 
         Returns:
-            str: Base64-encoded 32-byte key
+            bytes: Base64-encoded 32-byte key
+        """
+        return base64.urlsafe_b64encode(os.urandom(32))
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        """Compute the base64url-encoded HMAC signature of a JWT.
+
+        Args:
+            signing_input: Encoded header and payload joined by a dot
+
+        Returns:
+            bytes: Encoded signature
         """
-        return base64.urlsafe_b64encode(os.urandom(32)).decode()
+        # Only called on the inline path, where the template is set
+        assert self._hmac_template is not None
+        mac = self._hmac_template.copy()
+        mac.update(signing_input)
+        return _b64url_encode(mac.digest())
+
+    def _encode_token(self, claims: Dict[str, Any]) -> str:
+        """Encode and sign JWT claims.
+
+        Args:
+            claims: Claims to encode
+
+        Returns:
+            str: Encoded JWT token
+        """
+        if self._hmac_template is None:
+            import jwt
+
+            return jwt.encode(claims, self._secret_bytes, algorithm=self.algorithm)
+
+        signing_input = self._token_prefix + _b64url_encode(orjson.dumps(claims))
+        return (signing_input + b"." + self._sign(signing_input)).decode()
+
+    def _decode_token(self, token: str) -> Dict[str, Any]:
+        """Verify a JWT and decode its claims.
+
+        Validates the signature, the ``exp``, ``iat`` and ``nbf`` claims, and
+        rejects tokens carrying an audience, matching PyJWT's defaults. Inline
+        verification only accepts the exact header this class emits.
+
+        Args:
+            token: JWT token to decode
+
+        Returns:
+            Dict[str, Any]: Decoded claims
+
+        Raises:
+            ValueError: If the token is malformed, invalid or expired
+        """
+        if self._hmac_template is None:
+            import jwt
+
+            try:
+                return jwt.decode(
+                    token, self._secret_bytes, algorithms=[self.algorithm]
+                )
+            except (jwt.InvalidTokenError, TypeError) as e:
+                # PyJWT raises TypeError for a null exp/iat/nbf claim
+                raise ValueError(str(e)) from e
+
+        data = token.encode("ascii")
+        if not data.startswith(self._token_prefix):
+            raise ValueError("Invalid token header")
+        signing_input, _, signature = data.rpartition(b".")
+        payload_b64 = signing_input[len(self._token_prefix):]
+        if not payload_b64 or b"." in payload_b64:
+            raise ValueError("Not enough segments")
+
+        if not hmac.compare_digest(self._sign(signing_input), signature):
+            raise ValueError("Signature verification failed")
+
+        payload = orjson.loads(_b64url_decode(payload_b64))
+        if not isinstance(payload, dict):
+            raise ValueError("Invalid payload string: must be a json object")
+
+        now = time.time()
+        # Present claims must be numbers, as in PyJWT; a null exp would
+        # otherwise skip the expiry check and break cached TokenData
+        if "exp" in payload:
+            exp = payload["exp"]
+            if not isinstance(exp, (int, float)):
+                raise ValueError("Expiration Time claim (exp) must be a number")
+            if exp <= now:
+                raise ValueError("Signature has expired")
+        if "iat" in payload:
+            iat = payload["iat"]
+            if not isinstance(iat, (int, float)):
+                raise ValueError("Issued At claim (iat) must be a number")
+            if iat > now:
+                raise ValueError("The token is not yet valid (iat)")
+        if "nbf" in payload:
+            nbf = payload["nbf"]
+            if not isinstance(nbf, (int, float)):
+                raise ValueError("Not Before claim (nbf) must be a number")
+            if nbf > now:
+                raise ValueError("The token is not yet valid (nbf)")
+        if "aud" in payload:
+            raise ValueError("Invalid audience")
+        return payload
 
     def create_access_token(
         self,
@@ -128,7 +497,8 @@ def create_access_token(
         if expires_delta is None:
             expires_delta = timedelta(minutes=self.access_token_expire_minutes)
 
-        expire = datetime.utcnow() + expires_delta
+        # JWT "exp" is a NumericDate: seconds since the epoch
+        expire = int(time.time() + expires_delta.total_seconds())
         to_encode = {
             "sub": str(subject),
             "exp": expire,
@@ -136,11 +506,41 @@ def create_access_token(
         if scope:
             to_encode["scope"] = scope
 
-        return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        return self._encode_token(to_encode)
+
+    def create_token(
+        self,
+        subject: Union[str, int],
+        expires_delta: Optional[timedelta] = None,
+        scope: Optional[str] = None,
+    ) -> Token:
+        """Create a token response for a new JWT access token.
+
+        Args:
+            subject: Token subject (usually user ID)
+            expires_delta: Optional custom expiration time
+            scope: Optional token scope/permissions
+
+        Returns:
+            Token: Token response model
+        """
+        if expires_delta is None:
+            expires_delta = timedelta(minutes=self.access_token_expire_minutes)
+
+        # All fields are produced here, so validation is skipped
+        return Token.model_construct(
+            access_token=self.create_access_token(subject, expires_delta, scope),
+            token_type="bearer",
+            expires_in=int(expires_delta.total_seconds()),
+        )
 
     def verify_token(self, token: str) -> TokenData:
         """Verify and decode a JWT token.
 
+        Successfully verified tokens are cached until they expire, so a
+        token reused across requests is only decoded once. Rejected tokens
+        are remembered for a few seconds and rejected without decoding.
+
         Args:
             token: JWT token to verify
 
@@ -150,29 +550,78 @@ def verify_token(self, token: str) -> TokenData:
         Raises:
             HTTPException: If token is invalid or expired
         """
+        with self._token_cache_lock:
+            cached = self._token_cache.get(token)
+            if cached is not None:
+                if cached.exp > time.time():
+                    return cached
+                del self._token_cache[token]
+
+        token_digest = _token_digest(token)
+        with self._token_cache_lock:
+            if token_digest in self._invalid_token_cache:
+                raise HTTPException(
+                    status_code=401,
+                    detail="Could not validate credentials",
+                )
+
         try:
-            payload = jwt.decode(
-                token, self.secret_key, algorithms=[self.algorithm]
-            )
-            return TokenData(
+            payload = self._decode_token(token)
+            token_data = TokenData(
                 sub=payload["sub"],
-                exp=datetime.fromtimestamp(payload["exp"]),
+                exp=payload["exp"],
                 scope=payload.get("scope"),
             )
-        except JWTError as e:
+        except (ValueError, KeyError) as e:
             logger.error(f"Token verification failed: {str(e)}")
+            with self._token_cache_lock:
+                self._invalid_token_cache[token_digest] = True
             raise HTTPException(
                 status_code=401,
                 detail="Could not validate credentials",
             )
 
+        # Only valid tokens are cached, each until its own expiry
+        with self._token_cache_lock:
+            self._token_cache[token] = token_data
+        return token_data
+
     def generate_api_key(self) -> str:
         """Generate a new API key.
 
         Returns:
             str: Generated API key
         """
-        return secrets.token_urlsafe(32)
+        return _token_urlsafe(32)
+
+    def generate_api_keys_batch(self, count: int) -> List[str]:
+        """Generate many API keys, e.g. for bulk provisioning.
+
+        Keys have the same format as ``generate_api_key`` but draw from a
+        shared entropy buffer instead of one OS call per key.
+
+        Args:
+            count: Number of API keys to generate
+
+        Returns:
+            List[str]: Generated API keys
+        """
+        take = _entropy_pool.take
+        return [
+            base64.urlsafe_b64encode(take(32)).rstrip(b"=").decode()
+            for _ in range(count)
+        ]
+
+    def hash_api_key_raw(self, api_key: str) -> bytes:
+        """Hash an API key for storage as raw bytes.
+
+        Args:
+            api_key: API key to hash
+
+        Returns:
+            bytes: 32-byte SHA-256 digest of the API key
+        """
+        return _hash_api_key_digest(api_key)
 
     def hash_api_key(self, api_key: str) -> str:
         """Hash an API key for storage.
@@ -183,37 +632,140 @@ def hash_api_key(self, api_key: str) -> str:
         Returns:
             str: Hashed API key
         """
-        return hashlib.sha256(api_key.encode()).hexdigest()
+        return self.hash_api_key_raw(api_key).hex()
+
+    def hash_api_keys_batch(self, api_keys: List[str]) -> List[str]:
+        """Hash many API keys for storage, e.g. for bulk imports or rotation.
+
+        Args:
+            api_keys: API keys to hash
+
+        Returns:
+            List[str]: Hashed API keys, in input order
+        """
+        sha256 = _sha256
+        return [sha256(api_key.encode()).hexdigest() for api_key in api_keys]
+
+    @staticmethod
+    def api_key_hash_from_hex(hashed_key: str) -> bytes:
+        """Convert a legacy hex-encoded API key hash to raw bytes.
+
+        Args:
+            hashed_key: Hex-encoded hash as returned by ``hash_api_key``
+
+        Returns:
+            bytes: Raw digest as returned by ``hash_api_key_raw``
+        """
+        return bytes.fromhex(hashed_key)
 
-    def verify_api_key(self, api_key: str, hashed_key: str) -> bool:
+    def verify_api_key(
+        self, api_key: str, hashed_key: Union[str, bytes]
+    ) -> bool:
         """Verify an API key against its hash.
 
+        The comparison is done in constant time on the raw 32-byte digests.
+
         Args:
             api_key: API key to verify
-            hashed_key: Stored hash to verify against
+            hashed_key: Stored hash to verify against, either the raw digest
+                or its legacy hex encoding
 
         Returns:
             bool: True if API key is valid
         """
-        return hmac.compare_digest(
-            self.hash_api_key(api_key),
-            hashed_key,
+        if isinstance(hashed_key, str):
+            try:
+                hashed_key = self.api_key_hash_from_hex(hashed_key)
+            except ValueError:
+                return False
+        return hmac.compare_digest(self.hash_api_key_raw(api_key), hashed_key)
+
+    def encrypt_bytes(self, value: bytes) -> bytes:
+        """Encrypt a bytes value.
+
+        Produces a standard Fernet token using the signing and encryption
+        keys derived once per instance.
+
+        Args:
+            value: Bytes to encrypt
+
+        Returns:
+            bytes: Encrypted Fernet token
+        """
+        mac_template, aes, cipher, cbc = self._fernet_keys
+        iv = _entropy_pool.take(16)
+        pad = _AES_BLOCK_SIZE - len(value) % _AES_BLOCK_SIZE
+        encryptor = cipher(aes, cbc(iv)).encryptor()
+        ciphertext = (
+            encryptor.update(value + bytes((pad,)) * pad) + encryptor.finalize()
         )
 
+        basic_parts = (
+            _FERNET_VERSION + struct.pack(">Q", int(time.time())) + iv + ciphertext
+        )
+        mac = mac_template.copy()
+        mac.update(basic_parts)
+        return base64.urlsafe_b64encode(basic_parts + mac.digest())
+
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """Decrypt a Fernet token.
+
+        Args:
+            token: Fernet token to decrypt
+
+        Returns:
+            bytes: Decrypted value
+
+        Raises:
+            ValueError: If decryption fails
+        """
+        try:
+            mac_template, aes, cipher, cbc = self._fernet_keys
+            data = base64.urlsafe_b64decode(token)
+            if (
+                len(data) < _FERNET_CIPHERTEXT_OFFSET + _FERNET_MAC_SIZE
+                or data[:1] != _FERNET_VERSION
+            ):
+                raise ValueError("Invalid token")
+
+            basic_parts = data[:-_FERNET_MAC_SIZE]
+            mac = mac_template.copy()
+            mac.update(basic_parts)
+            if not hmac.compare_digest(mac.digest(), data[-_FERNET_MAC_SIZE:]):
+                raise ValueError("Invalid signature")
+
+            iv = basic_parts[_FERNET_IV_OFFSET:_FERNET_CIPHERTEXT_OFFSET]
+            decryptor = cipher(aes, cbc(iv)).decryptor()
+            padded = (
+                decryptor.update(basic_parts[_FERNET_CIPHERTEXT_OFFSET:])
+                + decryptor.finalize()
+            )
+            pad = padded[-1] if padded else 0
+            if not 0 < pad <= _AES_BLOCK_SIZE or padded[-pad:] != bytes((pad,)) * pad:
+                raise ValueError("Invalid padding")
+            return padded[:-pad]
+        except Exception as e:
+            logger.error(f"Decryption failed: {str(e)}")
+            raise ValueError("Failed to decrypt value")
+
     def encrypt_value(self, value: str) -> str:
         """Encrypt a string value.
 
+        Prefer ``encrypt_bytes`` when the result is stored as bytes.
+
         Args:
             value: String to encrypt
 
         Returns:
             str: Encrypted value
         """
-        return self.fernet.encrypt(value.encode()).decode()
+        return self.encrypt_bytes(value.encode()).decode()
 
     def decrypt_value(self, encrypted_value: str) -> str:
         """Decrypt an encrypted string value.
 
+        Prefer ``decrypt_bytes`` when the token is stored as bytes.
+
         Args:
             encrypted_value: String to decrypt
 
@@ -223,11 +775,7 @@ def decrypt_value(self, encrypted_value: str) -> str:
         Raises:
             ValueError: If decryption fails
         """
-        try:
-            return self.fernet.decrypt(encrypted_value.encode()).decode()
-        except Exception as e:
-            logger.error(f"Decryption failed: {str(e)}")
-            raise ValueError("Failed to decrypt value")
+        return self.decrypt_bytes(encrypted_value.encode()).decode()
 
     def hash_password(self, password: str) -> str:
         """Hash a password.
@@ -238,7 +786,10 @@ def hash_password(self, password: str) -> str:
         Returns:
             str: Hashed password
         """
-        return pwd_context.hash(password)
+        secret = password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+        with _bcrypt_slots:
+            hashed = bcrypt.hashpw(secret, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+        return hashed.decode()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash.
@@ -250,7 +801,137 @@ def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         Returns:
             bool: True if password is valid
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        secret = plain_password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+        with _bcrypt_slots:
+            return bcrypt.checkpw(secret, hashed_password.encode("utf-8"))
+
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password without blocking the event loop.
+
+        Args:
+            password: Password to hash
+
+        Returns:
+            str: Hashed password
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _bcrypt_executor, self.hash_password, password
+        )
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Verify a password against its hash without blocking the event loop.
+
+        Args:
+            plain_password: Password to verify
+            hashed_password: Stored hash to verify against
+
+        Returns:
+            bool: True if password is valid
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _bcrypt_executor, self.verify_password, plain_password, hashed_password
+        )
+
+
+class APIKeyCache:
+    """In-process cache of valid API key hashes.
+
+    Sits in front of the API key store so that most verifications are a
+    set lookup instead of a database round-trip. Keys are tracked by their
+    SHA-256 digest, never in plain text.
+
+    Once ``load`` has been called with every valid digest, the cache is
+    authoritative and unknown keys are rejected without calling the store.
+    Until then, misses fall back to the ``lookup`` callable; hits are
+    remembered for ``VERIFIED_API_KEY_CACHE_TTL`` seconds and misses for a
+    few seconds. A key revoked in the store is therefore still accepted for
+    up to a minute by processes that had verified it; ``discard`` revokes it
+    immediately, but only in the calling process.
+
+    Attributes:
+        lookup: Async callable checking a digest against the key store
+    """
+
+    def __init__(
+        self,
+        lookup: Optional[Callable[[bytes], Awaitable[bool]]] = None,
+    ) -> None:
+        """Initialize the API key cache.
+
+        Args:
+            lookup: Async callable checking a digest against the key store
+        """
+        self.lookup = lookup
+        self._digests: Set[bytes] = set()
+        self._authoritative = False
+        self._verified: TTLCache[bytes, bool] = TTLCache(
+            maxsize=VERIFIED_API_KEY_CACHE_SIZE,
+            ttl=VERIFIED_API_KEY_CACHE_TTL,
+        )
+        self._rejected: TTLCache[bytes, bool] = TTLCache(
+            maxsize=INVALID_API_KEY_CACHE_SIZE,
+            ttl=INVALID_API_KEY_CACHE_TTL,
+        )
+
+    def load(self, digests: Iterable[bytes]) -> None:
+        """Replace the cache with the full set of valid key digests.
+
+        Call on startup and after key rotation; afterwards unknown keys are
+        rejected without consulting the key store.
+
+        Args:
+            digests: SHA-256 digests of all valid API keys
+        """
+        self._digests = set(digests)
+        self._verified.clear()
+        self._rejected.clear()
+        self._authoritative = True
+
+    def add(self, digest: bytes) -> None:
+        """Mark a newly issued API key digest as valid.
+
+        Args:
+            digest: SHA-256 digest of the API key
+        """
+        if self._authoritative:
+            self._digests.add(digest)
+        else:
+            self._verified[digest] = True
+        self._rejected.pop(digest, None)
+
+    def discard(self, digest: bytes) -> None:
+        """Remove a revoked API key digest.
+
+        Args:
+            digest: SHA-256 digest of the API key
+        """
+        self._digests.discard(digest)
+        self._verified.pop(digest, None)
+
+    async def verify(self, api_key: str) -> bool:
+        """Check whether an API key is valid.
+
+        Args:
+            api_key: API key to verify
+
+        Returns:
+            bool: True if API key is valid
+        """
+        digest = _hash_api_key_digest(api_key)
+        if digest in self._digests or digest in self._verified:
+            return True
+        if self._authoritative or self.lookup is None or digest in self._rejected:
+            return False
+
+        if await self.lookup(digest):
+            self._verified[digest] = True
+            return True
+        self._rejected[digest] = True
+        return False
 
 
 async def get_current_user(
@@ -270,7 +951,7 @@ async def get_current_user(
         HTTPException: If token is invalid or expired
     """
     token_data = security_config.verify_token(token)
-    if token_data.exp < datetime.utcnow():
+    if token_data.exp < time.time():
         raise HTTPException(
             status_code=401,
             detail="Token has expired",
@@ -284,6 +965,9 @@ async def verify_api_key(
 ) -> str:
     """Verify API key from request header.
 
+    When the application has an ``APIKeyCache`` in ``app.state.api_key_cache``
+    the key is checked against it.
+
     Args:
         request: FastAPI request object
         api_key: API key from request header
@@ -299,7 +983,17 @@ async def verify_api_key(
             status_code=401,
             detail="API key is required",
         )
-    
-    # Here you would typically verify the API key against your database
-    # This is a placeholder that should be implemented based on your storage
+
+    api_key_cache: Optional[APIKeyCache] = getattr(
+        request.app.state, "api_key_cache", None
+    )
+    if api_key_cache is None:
+        # No key store configured for this service; accept any key
+        return api_key
+
+    if not await api_key_cache.verify(api_key):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid API key",
+        )
     return api_key 
\ No newline at end of file